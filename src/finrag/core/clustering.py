@@ -1,6 +1,7 @@
 """
 RAPTOR-style clustering implementation for FinRAG.
 """
+from collections import defaultdict
 from typing import List, Dict, Any, Optional
 import numpy as np
 from sklearn.cluster import DBSCAN, KMeans
@@ -12,6 +13,10 @@ from dataclasses import dataclass
 @dataclass
 class ClusterNode:
     """Represents a node in the RAPTOR tree."""
+    # Slots drop the per-instance __dict__ and make attribute access an
+    # offset load - meaningful at thousands of Layer-0 nodes per tree
+    __slots__ = ('node_id', 'text', 'embedding', 'children', 'level', 'metadata')
+
     node_id: str
     text: str
     embedding: np.ndarray
@@ -63,10 +68,19 @@ class RAPTORClustering:
         """
         if dim is None:
             dim = self.reduction_dimension
-        
+
+        # float32 halves the bytes moved through UMAP versus the float64
+        # arrays built from API responses, and is its native compute dtype
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+
+        # UMAP on N <= d(+1) points is numerically degenerate and pays its
+        # setup cost for nothing - the raw embeddings are just as usable
+        if len(embeddings) <= dim + 1:
+            return embeddings
+
         if n_neighbors is None:
             n_neighbors = int((len(embeddings) - 1) ** 0.5)
-        
+
         reducer = umap.UMAP(
             n_neighbors=n_neighbors,
             n_components=min(dim, len(embeddings) - 2),
@@ -97,7 +111,12 @@ class RAPTORClustering:
         """
         if dim is None:
             dim = self.reduction_dimension
-        
+
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+
+        if len(embeddings) <= dim + 1:
+            return embeddings
+
         reducer = umap.UMAP(
             n_neighbors=num_neighbors,
             n_components=min(dim, len(embeddings) - 2),
@@ -124,6 +143,10 @@ class RAPTORClustering:
         Returns:
             Optimal number of clusters
         """
+        # Too few points for the BIC sweep to say anything useful
+        if len(embeddings) <= 2:
+            return 1
+
         max_clusters = min(max_clusters, len(embeddings))
         n_clusters = np.arange(1, max_clusters)
         bics = []
@@ -232,31 +255,28 @@ class RAPTORClustering:
         """
         if metadata_keys is None:
             metadata_keys = self.metadata_keys
-        
-        metadata_groups = {}
-        
+
+        # Single pass: one normalized tuple key and one dict lookup per node
+        metadata_groups = defaultdict(list)
+
         for idx, node in enumerate(nodes):
-            # Extract metadata values
-            metadata_values = []
-            for key in metadata_keys:
-                value = node.metadata.get(key, "unknown")
-                # Normalize the value
-                if value is None:
-                    value = "unknown"
-                elif isinstance(value, (int, float)):
-                    value = str(value)
-                elif not isinstance(value, str):
-                    value = str(value)
-                metadata_values.append(value.lower().strip())
-            
-            # Create metadata tuple as key
-            metadata_key = tuple(metadata_values)
-            
-            if metadata_key not in metadata_groups:
-                metadata_groups[metadata_key] = []
+            metadata = node.metadata
+            metadata_key = tuple(
+                self._normalize_metadata_value(metadata.get(key, "unknown"))
+                for key in metadata_keys
+            )
             metadata_groups[metadata_key].append(idx)
-        
-        return metadata_groups
+
+        return dict(metadata_groups)
+
+    @staticmethod
+    def _normalize_metadata_value(value) -> str:
+        """Normalize a metadata value to a lowercase stripped string."""
+        if value is None:
+            return "unknown"
+        if not isinstance(value, str):
+            value = str(value)
+        return value.lower().strip()
     
     def perform_metadata_clustering(
         self,
@@ -371,28 +391,8 @@ class RAPTORClustering:
             return [np.arange(len(embeddings))]
         
         # Group by the specified metadata keys
-        metadata_groups = {}
-        for idx, node in enumerate(nodes):
-            # Extract metadata values for grouping
-            metadata_values = []
-            for key in grouping_keys:
-                value = node.metadata.get(key, "unknown")
-                # Normalize the value
-                if value is None:
-                    value = "unknown"
-                elif isinstance(value, (int, float)):
-                    value = str(value)
-                elif not isinstance(value, str):
-                    value = str(value)
-                metadata_values.append(value.lower().strip())
-            
-            # Create metadata tuple as key
-            metadata_key = tuple(metadata_values)
-            
-            if metadata_key not in metadata_groups:
-                metadata_groups[metadata_key] = []
-            metadata_groups[metadata_key].append(idx)
-        
+        metadata_groups = self.extract_metadata_groups(nodes, grouping_keys)
+
         print(f"  Level {current_level} grouping by {grouping_keys}: {len(metadata_groups)} groups")
         
         all_clusters = []
@@ -447,6 +447,33 @@ class RAPTORClustering:
         Returns:
             List of clusters (each cluster is an array of indices)
         """
+        # Fast paths for trivial inputs - no point running UMAP/BIC on
+        # zero or one node, or on a homogeneous group that would come back
+        # as a single cluster anyway
+        n = len(embeddings)
+        if n == 0:
+            return []
+        if n == 1:
+            return [np.array([0])]
+
+        if (
+            self.use_metadata_clustering
+            and nodes is not None
+            and n <= self.max_cluster_size
+        ):
+            first_key = tuple(
+                self._normalize_metadata_value(nodes[0].metadata.get(key, "unknown"))
+                for key in self.metadata_keys
+            )
+            if all(
+                tuple(
+                    self._normalize_metadata_value(node.metadata.get(key, "unknown"))
+                    for key in self.metadata_keys
+                ) == first_key
+                for node in nodes[1:]
+            ):
+                return [np.arange(n)]
+
         if self.use_metadata_clustering and nodes is not None:
             if current_level is not None:
                 # Use fixed hierarchical clustering
@@ -1,6 +1,7 @@
 """
 RAPTOR Tree implementation for hierarchical document organization.
 """
+from collections import defaultdict
 from typing import List, Dict, Any, Optional
 import numpy as np
 from dataclasses import dataclass, asdict
@@ -8,6 +9,13 @@ import json
 import pickle
 from pathlib import Path
 
+# orjson serializes/parses the node dicts at C level - a large win when
+# the tree holds thousands of nodes with embedded vectors
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .clustering import RAPTORClustering, ClusterNode
 from .base_models import BaseEmbeddingModel, BaseSummarizationModel
 
@@ -57,6 +65,9 @@ class RAPTORTree:
         self.root_nodes: List[ClusterNode] = []
         self.all_nodes: Dict[str, ClusterNode] = {}
         self.leaf_nodes: List[ClusterNode] = []
+        # Highest level seen so far, tracked incrementally so depth
+        # queries don't scan every node
+        self.max_level: int = 0
     
     def build_tree(
         self,
@@ -257,7 +268,10 @@ class RAPTORTree:
             
             new_nodes.append(parent_node)
             self.all_nodes[parent_node.node_id] = parent_node
-        
+
+        if new_nodes and level > self.max_level:
+            self.max_level = level
+
         return new_nodes
     
     def save(self, path: str) -> None:
@@ -286,8 +300,12 @@ class RAPTORTree:
             }
         
         # Save as JSON (primary format - always works)
-        with open(save_path / "tree.json", "w") as f:
-            json.dump(tree_data, f, indent=2)
+        if orjson is not None:
+            with open(save_path / "tree.json", "wb") as f:
+                f.write(orjson.dumps(tree_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(save_path / "tree.json", "w") as f:
+                json.dump(tree_data, f, indent=2)
         
         # Try to save as pickle (faster to load but can fail with threading objects)
         try:
@@ -338,8 +356,12 @@ class RAPTORTree:
         if not json_path.exists():
             raise FileNotFoundError(f"No tree found at {path}. Expected tree.json or tree.pkl")
         
-        with open(json_path, "r") as f:
-            tree_data = json.load(f)
+        if orjson is not None:
+            with open(json_path, "rb") as f:
+                tree_data = orjson.loads(f.read())
+        else:
+            with open(json_path, "r") as f:
+                tree_data = json.load(f)
         
         # Reconstruct tree
         config = TreeConfig(**tree_data["config"])
@@ -367,10 +389,24 @@ class RAPTORTree:
         tree.all_nodes = all_nodes
         tree.root_nodes = [all_nodes[node_id] for node_id in tree_data["root_node_ids"]]
         tree.leaf_nodes = [all_nodes[node_id] for node_id in tree_data["leaf_node_ids"]]
+        tree.max_level = max((node.level for node in all_nodes.values()), default=0)
         
         print("  ✓ Loaded from JSON")
         return tree
     
+    def get_tree_depth(self) -> int:
+        """Get the number of levels in the tree (O(1) via tracked max level)."""
+        if not self.all_nodes:
+            return 0
+        return self.max_level + 1
+
+    def get_nodes_by_level(self) -> Dict[int, List[ClusterNode]]:
+        """Group all nodes by level in one O(N) pass."""
+        by_level = defaultdict(list)
+        for node in self.all_nodes.values():
+            by_level[node.level].append(node)
+        return dict(by_level)
+
     def get_all_texts(self) -> List[str]:
         """Get all texts in the tree."""
         return [node.text for node in self.all_nodes.values()]
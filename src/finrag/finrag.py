@@ -2,7 +2,6 @@
 Main FinRAG implementation combining all components.
 """
 from typing import List, Dict, Any, Optional
-import numpy as np
 from pathlib import Path
 import PyPDF2
 import os
@@ -264,17 +263,11 @@ class FinRAG:
         print(f"Created {len(all_chunks)} chunks")
         
         print("Creating embeddings...")
-        # Create embeddings in batches
-        batch_size = 100
-        embeddings_list = []
-        
-        for i in range(0, len(all_chunks), batch_size):
-            batch = all_chunks[i:i+batch_size]
-            batch_texts = [chunk["text"] for chunk in batch]
-            batch_embeddings = self.embedding_model.create_embeddings(batch_texts)
-            embeddings_list.append(batch_embeddings)
-        
-        embeddings = np.vstack(embeddings_list)
+        # One batched call: the embedding model windows large inputs to the
+        # API limit internally, so no 100-chunk loop is needed here
+        embeddings = self.embedding_model.create_embeddings(
+            [chunk["text"] for chunk in all_chunks]
+        )
         print(f"Created {len(embeddings)} embeddings")
         
         print("Building RAPTOR tree...")
@@ -399,5 +392,5 @@ class FinRAG:
             "leaf_nodes": len(self.tree.leaf_nodes),
             "root_nodes": len(self.tree.root_nodes),
             "levels": levels,
-            "tree_depth": max(levels.keys()) if levels else 0
+            "tree_depth": self.tree.max_level
         }
@@ -1,6 +1,11 @@
 """
 OpenAI-based implementations of base models.
 """
+import atexit
+import hashlib
+import pickle
+from collections import OrderedDict
+from pathlib import Path
 from typing import List, Dict, Any
 import numpy as np
 from openai import OpenAI
@@ -10,54 +15,252 @@ import re
 
 from ..core.base_models import BaseEmbeddingModel, BaseSummarizationModel, BaseQAModel, BaseChunker
 
+# Metadata extraction patterns, compiled once at import time so chunk
+# ingestion pays only the scanning cost, not per-call recompilation
+
+# 4-digit years (1900-2099)
+_YEAR_RE = re.compile(r'\b(19\d{2}|20\d{2})\b')
+
+# Company names: "Company Name Inc.", "Company Name Corp", etc.
+# Word-by-word with bounded repetition ({0,4} extra words, capitalized or a
+# lowercase connector as in "Bank of America") so the engine cannot
+# backtrack across whitespace the way the old [a-zA-Z\s&]+ did; suffixes
+# are ordered longest-first because there is no trailing \b.
+_COMPANY_RES = (
+    re.compile(r'\b([A-Z][A-Za-z&]*(?:\s(?:[A-Z&][A-Za-z&]*|of|and|the|for)){0,4}\s'
+               r'(?:Corporation|Company|Limited|Corp|Inc|Ltd|LLC|Co)\.?)(?![A-Za-z])'),
+    re.compile(r'\b([A-Z][a-zA-Z]+(?:\s[A-Z][a-zA-Z]+){1,3})\s+(?:Inc|Corp|Corporation|Ltd|Limited|LLC)'),
+)
+
+# Common financial sectors and their indicator keywords
+_SECTORS = {
+    "technology": ["technology", "software", "tech", "IT", "digital", "cloud"],
+    "finance": ["financial", "bank", "insurance", "investment", "securities"],
+    "healthcare": ["healthcare", "pharmaceutical", "medical", "biotech", "health"],
+    "energy": ["energy", "oil", "gas", "renewable", "utilities"],
+    "retail": ["retail", "consumer", "e-commerce", "commerce"],
+    "manufacturing": ["manufacturing", "industrial", "automotive", "production"],
+    "real estate": ["real estate", "property", "REIT"],
+    "telecommunications": ["telecommunications", "telecom", "communications"]
+}
+
+# Optional Aho-Corasick automaton: all sector keywords found in one linear
+# pass over the text instead of one count() scan per keyword. Keywords are
+# added verbatim (the scan runs on lowered text, matching the substring
+# semantics of the fallback loop), and each hit maps back to its sector.
+# Scanning uses iter_long() - non-overlapping, longest match per position -
+# so the scores agree exactly with the regex fallback below whether or not
+# pyahocorasick is installed.
+try:
+    import ahocorasick
+
+    _SECTOR_AUTOMATON = ahocorasick.Automaton()
+    for _sector, _keywords in _SECTORS.items():
+        for _kw in _keywords:
+            _SECTOR_AUTOMATON.add_word(_kw, _sector)
+    _SECTOR_AUTOMATON.make_automaton()
+except ImportError:
+    _SECTOR_AUTOMATON = None
+
+# Fallback single-pass scanner: one case-insensitive alternation over the
+# original text replaces a count() scan (and a lowered copy) per keyword.
+# Keywords with uppercase letters (IT, REIT) are skipped - they could never
+# match the lowered text the keyword counting has always run against.
+# Longest-first ordering keeps e.g. 'technology' from splitting into 'tech'.
+_SECTOR_KEYWORD_MAP = {
+    keyword: sector
+    for sector, keywords in _SECTORS.items()
+    for keyword in keywords
+    if keyword == keyword.lower()
+}
+_SECTOR_RE = re.compile(
+    '|'.join(sorted(map(re.escape, _SECTOR_KEYWORD_MAP), key=len, reverse=True)),
+    re.IGNORECASE
+)
+
+
+# Embedding cache shared by all OpenAIEmbeddingModel instances: a bounded
+# in-memory LRU persisted to disk at exit, so repeated test/example runs
+# skip the network round trip entirely. Keys are sha256 of "model|text".
+_EMBED_CACHE_PATH = Path.home() / ".cache" / "finrag" / "embeddings.pkl"
+# ~12 KB per text-embedding-3-small vector puts the ceiling around 600 MB
+_EMBED_CACHE_LIMIT = 50_000
+_embed_cache = None
+_embed_cache_dirty = False
+
+
+def _get_embed_cache() -> "OrderedDict[str, np.ndarray]":
+    """Load the on-disk embedding cache on first use."""
+    global _embed_cache
+    if _embed_cache is None:
+        try:
+            with open(_EMBED_CACHE_PATH, "rb") as f:
+                _embed_cache = OrderedDict(pickle.load(f))
+            # Trim caches written before the limit (or a larger one) existed
+            while len(_embed_cache) > _EMBED_CACHE_LIMIT:
+                _embed_cache.popitem(last=False)
+        except Exception:
+            _embed_cache = OrderedDict()
+        atexit.register(_save_embed_cache)
+    return _embed_cache
+
+
+def _save_embed_cache() -> None:
+    """Persist the embedding cache if anything was added this run."""
+    if not _embed_cache_dirty or not _embed_cache:
+        return
+    try:
+        _EMBED_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(_EMBED_CACHE_PATH, "wb") as f:
+            pickle.dump(dict(_embed_cache), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        print(f"Warning: could not save embedding cache: {e}")
+
+
+def _embed_cache_key(model: str, text: str) -> str:
+    return hashlib.sha256(f"{model}|{text}".encode("utf-8")).hexdigest()
+
+
+def _embed_cache_get(key: str) -> np.ndarray:
+    """Look up a cached embedding, refreshing its LRU position on a hit."""
+    cache = _get_embed_cache()
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _embed_cache_put(key: str, value: np.ndarray) -> None:
+    """Store an embedding, evicting the least recently used past the limit."""
+    global _embed_cache_dirty
+    cache = _get_embed_cache()
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > _EMBED_CACHE_LIMIT:
+        cache.popitem(last=False)
+    _embed_cache_dirty = True
+
+
+# Maximum number of inputs the OpenAI embeddings endpoint accepts per call
+_EMBED_BATCH_LIMIT = 2048
+# The endpoint also caps total tokens per request (~300k). Window budgets
+# use a conservative ~3 chars/token estimate so a full window of long
+# chunks can never trip the cap.
+_EMBED_BATCH_TOKEN_LIMIT = 250_000
+
+
+def _estimated_tokens(text: str) -> int:
+    """Cheap token-count overestimate (~3 chars/token) for window budgeting."""
+    return len(text) // 3 + 1
+
 
 class OpenAIEmbeddingModel(BaseEmbeddingModel):
-    """OpenAI embedding model implementation."""
-    
-    def __init__(self, model: str = "text-embedding-3-small", api_key: str = None):
+    """
+    OpenAI embedding model implementation.
+
+    Pass use_cache=True to reuse embeddings across runs via the on-disk
+    LRU cache - intended for tests and example scripts, where the same
+    texts are embedded repeatedly. It is off by default so production
+    ingestion never serves stale entries for re-edited documents.
+    """
+
+    def __init__(self, model: str = "text-embedding-3-small", api_key: str = None, use_cache: bool = False):
         self.model = model
         self.client = OpenAI(api_key=api_key)
-    
+        self.use_cache = use_cache
+
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
     def create_embedding(self, text: str) -> np.ndarray:
         """Create embedding for given text."""
         if not text or not text.strip():
             raise ValueError("Cannot create embedding for empty text")
-        
+
+        text = text.strip()
+
+        if self.use_cache:
+            cached = _embed_cache_get(_embed_cache_key(self.model, text))
+            if cached is not None:
+                return cached
+
         try:
             response = self.client.embeddings.create(
-                input=text.strip(),
+                input=text,
                 model=self.model
             )
-            return np.array(response.data[0].embedding)
+            embedding = np.array(response.data[0].embedding)
+            if self.use_cache:
+                _embed_cache_put(_embed_cache_key(self.model, text), embedding)
+            return embedding
         except Exception as e:
             print(f"Error creating embedding: {e}")
             print(f"Text length: {len(text)}, Text preview: {text[:100]}...")
             raise
-    
+
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
     def create_embeddings(self, texts: List[str]) -> np.ndarray:
         """Create embeddings for multiple texts."""
         # Filter out empty texts and strip whitespace
         valid_texts = [text.strip() for text in texts if text and text.strip()]
-        
+
         if not valid_texts:
             raise ValueError("Cannot create embeddings for empty text list")
-        
+
         if len(valid_texts) != len(texts):
             print(f"Warning: Filtered out {len(texts) - len(valid_texts)} empty texts")
-        
+
+        # Serve hits from the cache and batch only the misses into one call
+        embeddings: List[np.ndarray] = [None] * len(valid_texts)
+        miss_positions = []
+
+        if self.use_cache:
+            for pos, text in enumerate(valid_texts):
+                cached = _embed_cache_get(_embed_cache_key(self.model, text))
+                if cached is not None:
+                    embeddings[pos] = cached
+                else:
+                    miss_positions.append(pos)
+        else:
+            miss_positions = list(range(len(valid_texts)))
+
+        if not miss_positions:
+            return np.array(embeddings)
+
+        miss_texts = [valid_texts[pos] for pos in miss_positions]
+
         try:
-            response = self.client.embeddings.create(
-                input=valid_texts,
-                model=self.model
-            )
-            embeddings = [np.array(item.embedding) for item in response.data]
+            # The embeddings endpoint accepts up to 2048 inputs and ~300k
+            # total tokens per request, so windows grow until either budget
+            # is hit - as few calls as possible without tripping a 400
+            window_start = 0
+            while window_start < len(miss_texts):
+                window_end = window_start
+                window_tokens = 0
+                while (window_end < len(miss_texts)
+                       and window_end - window_start < _EMBED_BATCH_LIMIT):
+                    text_tokens = _estimated_tokens(miss_texts[window_end])
+                    if (window_tokens + text_tokens > _EMBED_BATCH_TOKEN_LIMIT
+                            and window_end > window_start):
+                        break
+                    window_tokens += text_tokens
+                    window_end += 1
+
+                window = miss_texts[window_start:window_end]
+                response = self.client.embeddings.create(
+                    input=window,
+                    model=self.model
+                )
+                window_positions = miss_positions[window_start:window_end]
+                window_start = window_end
+                for pos, item in zip(window_positions, response.data):
+                    embedding = np.array(item.embedding)
+                    embeddings[pos] = embedding
+                    if self.use_cache:
+                        _embed_cache_put(_embed_cache_key(self.model, valid_texts[pos]), embedding)
             return np.array(embeddings)
         except Exception as e:
             print(f"Error creating embeddings: {e}")
-            print(f"Number of texts: {len(valid_texts)}")
-            print(f"Text lengths: {[len(t) for t in valid_texts[:5]]}...")
+            print(f"Number of texts: {len(miss_texts)}")
+            print(f"Text lengths: {[len(t) for t in miss_texts[:5]]}...")
             raise
 
 
@@ -150,6 +353,9 @@ class FinancialChunker(BaseChunker):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.encoding = tiktoken.encoding_for_model(model)
+        # Memoized extract_metadata results keyed by text prefix; documents
+        # re-ingested in the same run skip the regex passes entirely
+        self._metadata_cache: Dict[str, Dict[str, Any]] = {}
     
     def chunk_text(self, text: str) -> List[Dict[str, Any]]:
         """Chunk text with financial context awareness."""
@@ -208,7 +414,16 @@ class FinancialChunker(BaseChunker):
         """
         if chunk_text is None:
             chunk_text = text
-        
+
+        # Only the leading slices of `text` are scanned, so the 5000-char
+        # prefix covers everything the extraction can depend on. The prefix
+        # itself is the key - a bare hash() could silently alias two
+        # different documents on collision
+        cache_key = text[:5000]
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
         metadata = {
             "sector": None,
             "company": None,
@@ -216,50 +431,40 @@ class FinancialChunker(BaseChunker):
         }
         
         # Extract year - look for 4-digit years (1900-2099)
-        year_pattern = r'\b(19\d{2}|20\d{2})\b'
-        years = re.findall(year_pattern, text[:2000])  # Check first 2000 chars
+        years = _YEAR_RE.findall(text[:2000])  # Check first 2000 chars
         if years:
             # Most common year or most recent
             metadata["year"] = max(set(years), key=years.count)
-        
+
         # Extract company - look for common patterns
         # Pattern 1: "Company Name Inc.", "Company Name Corp", etc.
-        company_patterns = [
-            r'\b([A-Z][a-zA-Z\s&]+(?:Inc|Corp|Corporation|Ltd|Limited|LLC|Company|Co)\.?)\b',
-            r'\b([A-Z][a-zA-Z]+(?:\s[A-Z][a-zA-Z]+){1,3})\s+(?:Inc|Corp|Corporation|Ltd|Limited|LLC)',
-        ]
-        
-        for pattern in company_patterns:
-            companies = re.findall(pattern, text[:1000])
+        for pattern in _COMPANY_RES:
+            companies = pattern.findall(text[:1000])
             if companies:
                 # Take the most common or first occurrence
                 metadata["company"] = companies[0] if isinstance(companies[0], str) else companies[0][0]
                 break
-        
+
         # Extract sector - look for common financial sectors
-        sectors = {
-            "technology": ["technology", "software", "tech", "IT", "digital", "cloud"],
-            "finance": ["financial", "bank", "insurance", "investment", "securities"],
-            "healthcare": ["healthcare", "pharmaceutical", "medical", "biotech", "health"],
-            "energy": ["energy", "oil", "gas", "renewable", "utilities"],
-            "retail": ["retail", "consumer", "e-commerce", "commerce"],
-            "manufacturing": ["manufacturing", "industrial", "automotive", "production"],
-            "real estate": ["real estate", "property", "REIT"],
-            "telecommunications": ["telecommunications", "telecom", "communications"]
-        }
-        
-        text_lower = text[:5000].lower()  # Check first 5000 chars
+        text_head = text[:5000]  # Check first 5000 chars
         sector_scores = {}
-        
-        for sector_name, keywords in sectors.items():
-            score = sum(text_lower.count(keyword) for keyword in keywords)
-            if score > 0:
-                sector_scores[sector_name] = score
-        
+
+        if _SECTOR_AUTOMATON is not None:
+            for _, sector_name in _SECTOR_AUTOMATON.iter_long(text_head.lower()):
+                sector_scores[sector_name] = sector_scores.get(sector_name, 0) + 1
+        else:
+            for match in _SECTOR_RE.finditer(text_head):
+                sector_name = _SECTOR_KEYWORD_MAP[match.group(0).lower()]
+                sector_scores[sector_name] = sector_scores.get(sector_name, 0) + 1
+
         if sector_scores:
             metadata["sector"] = max(sector_scores, key=sector_scores.get)
-        
-        return metadata
+
+        if len(self._metadata_cache) >= 4096:  # Bound memory on huge ingests
+            self._metadata_cache.clear()
+        self._metadata_cache[cache_key] = metadata
+
+        return dict(metadata)
     
     def chunk_text_with_metadata(
         self,
@@ -1,36 +1,110 @@
 """
 Fetch financial ratios and market data using yfinance.
 """
+import os
+
 import yfinance as yf
+import requests
+from requests.adapters import HTTPAdapter, Retry
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 import numpy as np
 
+# Maximum number of yf.Ticker objects kept alive for reuse
+_TICKER_POOL_SIZE = 256
+
+
+# Fields used to gauge data completeness, frozen at module scope so the
+# completeness check doesn't rebuild the list per yfinance response
+_KEY_FIELDS = (
+    'currentPrice', 'marketCap', 'trailingPE', 'profitMargins',
+    'revenueGrowth', 'returnOnEquity', 'debtToEquity', 'freeCashflow',
+    'forwardPE', 'priceToBook', 'operatingMargins', 'beta'
+)
+_KEY_FIELDS_PCT = 100.0 / len(_KEY_FIELDS)
+
+
+def _skip_history_default() -> bool:
+    """Check FINRAG_SKIP_HISTORY so ops can disable history fetches globally."""
+    return os.getenv("FINRAG_SKIP_HISTORY", "false").lower() == "true"
+
 
 class FinancialDataFetcher:
     """Fetch and process financial data from Yahoo Finance."""
     
     def __init__(self):
         """Initialize the financial data fetcher."""
-        pass
-    
-    def get_company_data(self, ticker: str) -> Dict[str, Any]:
+        # Persistent HTTP session so TCP/TLS handshakes are amortized
+        # across tickers instead of paid per yf.Ticker instance
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        ))
+        self._ticker_pool: Dict[str, yf.Ticker] = {}
+        # Newer yfinance releases require a curl_cffi session and reject a
+        # plain requests.Session; once that happens, stop injecting ours and
+        # let yfinance manage its own session instead of failing every fetch
+        self._inject_session = True
+
+    def _get_ticker(self, ticker: str) -> yf.Ticker:
+        """Get a pooled yf.Ticker bound to the shared session."""
+        stock = self._ticker_pool.get(ticker)
+        if stock is None:
+            if len(self._ticker_pool) >= _TICKER_POOL_SIZE:
+                # Drop the oldest entry (insertion order) to bound memory
+                self._ticker_pool.pop(next(iter(self._ticker_pool)))
+            if self._inject_session:
+                try:
+                    stock = yf.Ticker(ticker, session=self._session)
+                except Exception as e:
+                    self._drop_shared_session(e)
+            if not self._inject_session:
+                stock = yf.Ticker(ticker)
+            self._ticker_pool[ticker] = stock
+        return stock
+
+    def _drop_shared_session(self, error: Exception) -> None:
+        """Stop injecting the shared session and evict tickers bound to it."""
+        print(f"Warning: yfinance rejected the shared session ({error}), "
+              f"falling back to per-ticker sessions")
+        self._inject_session = False
+        # Pooled tickers carry the rejected session; rebuild them on demand
+        self._ticker_pool.clear()
+
+    @staticmethod
+    def _is_session_error(error: Exception) -> bool:
+        """Detect yfinance's curl_cffi session-type rejection."""
+        message = str(error).lower()
+        return "curl_cffi" in message or "session" in message
+
+
+    def get_company_data(self, ticker: str, need_history: bool = None) -> Dict[str, Any]:
         """
         Get comprehensive financial data for a company.
-        
+
         Args:
             ticker: Stock ticker symbol (e.g., 'AAPL', 'RELIANCE.NS')
-        
+            need_history: Whether to download 1y of price history for the
+                momentum indicators. Skipping it halves the HTTP round trips
+                when momentum scoring isn't needed. Defaults to True unless
+                FINRAG_SKIP_HISTORY is set.
+
         Returns:
             Dictionary containing financial ratios and metrics
         """
+        if need_history is None:
+            need_history = not _skip_history_default()
+
         try:
-            stock = yf.Ticker(ticker)
+            stock = self._get_ticker(ticker)
             info = stock.info
-            
+
             # Get historical data for momentum calculation
-            hist = stock.history(period="1y")
-            
+            # (QuantitativeScorer tolerates the missing price_change_* keys)
+            hist = stock.history(period="1y") if need_history else None
+
             data = {
                 "ticker": ticker,
                 "company_name": info.get("longName", ticker),
@@ -105,6 +179,12 @@ class FinancialDataFetcher:
             return data
             
         except Exception as e:
+            # Releases that enforce curl_cffi reject the shared session on
+            # the first request, not at construction - fall back once and
+            # retry instead of degrading every ticker to the error dict
+            if self._inject_session and self._is_session_error(e):
+                self._drop_shared_session(e)
+                return self.get_company_data(ticker, need_history)
             print(f"Error fetching data for {ticker}: {str(e)}")
             return {
                 "ticker": ticker,
@@ -115,6 +195,8 @@ class FinancialDataFetcher:
     def _calculate_price_change(self, hist, days: int) -> Optional[float]:
         """Calculate percentage price change over specified days."""
         try:
+            if hist is None:
+                return None
             if len(hist) < days:
                 days = len(hist)
             if days < 2:
@@ -130,7 +212,7 @@ class FinancialDataFetcher:
     def _calculate_volatility(self, hist) -> Optional[float]:
         """Calculate annualized volatility."""
         try:
-            if len(hist) < 20:
+            if hist is None or len(hist) < 20:
                 return None
             
             returns = hist['Close'].pct_change().dropna()
@@ -141,14 +223,8 @@ class FinancialDataFetcher:
     
     def _calculate_completeness(self, info: Dict) -> float:
         """Calculate data completeness score (0-100)."""
-        key_fields = [
-            'currentPrice', 'marketCap', 'trailingPE', 'profitMargins',
-            'revenueGrowth', 'returnOnEquity', 'debtToEquity', 'freeCashflow',
-            'forwardPE', 'priceToBook', 'operatingMargins', 'beta'
-        ]
-        
-        available = sum(1 for field in key_fields if info.get(field) is not None)
-        return (available / len(key_fields)) * 100
+        available = sum(1 for field in _KEY_FIELDS if info.get(field) is not None)
+        return available * _KEY_FIELDS_PCT
     
     def get_peer_comparison(self, ticker: str, sector: str = None) -> Dict[str, Any]:
         """
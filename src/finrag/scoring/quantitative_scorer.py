@@ -1,10 +1,44 @@
 """
 Quantitative scoring based on financial ratios from yfinance.
 """
-from typing import Dict, Any
+from typing import Dict, Any, List
 import numpy as np
 
 
+def _metric_column(data_list: List[Dict], key: str, scale: float = 1.0) -> np.ndarray:
+    """Extract one metric across all tickers as a float column (NaN = missing)."""
+    return np.array(
+        [d[key] * scale if isinstance(d.get(key), (int, float)) else np.nan
+         for d in data_list],
+        dtype=np.float64
+    )
+
+
+def _ladder_scores(
+    values: np.ndarray,
+    thresholds: np.ndarray,
+    bucket_scores: np.ndarray,
+    side: str = "left"
+) -> np.ndarray:
+    """
+    Bucket a metric column into scores via searchsorted.
+    side="left" reproduces '> threshold' ladders, side="right" reproduces
+    '< threshold' ladders. NaN inputs stay NaN (metric unavailable).
+    """
+    out = np.full(values.shape, np.nan)
+    mask = ~np.isnan(values)
+    if mask.any():
+        out[mask] = bucket_scores[np.searchsorted(thresholds, values[mask], side=side)]
+    return out
+
+
+def _category_mean(score_matrix: np.ndarray) -> np.ndarray:
+    """Mean of the available metric scores per ticker, 50 where none exist."""
+    counts = (~np.isnan(score_matrix)).sum(axis=0)
+    sums = np.nansum(score_matrix, axis=0)
+    return np.where(counts > 0, sums / np.maximum(counts, 1), 50.0)
+
+
 class QuantitativeScorer:
     """Score stocks based on quantitative financial metrics."""
     
@@ -17,6 +51,14 @@ class QuantitativeScorer:
             "financial_health": 0.15,  # Debt, cash flow
             "momentum": 0.15        # Price trends, analyst ratings
         }
+        # Weight vector in category order, precomputed for the weighted sum
+        self._weight_vec = np.fromiter(self.weights.values(), dtype=np.float64)
+        # Momentum lookup tables: price-change thresholds map into scores
+        # via searchsorted, replacing the per-period if/elif ladder
+        self._momentum_keys = ("price_change_1m", "price_change_3m", "price_change_6m", "price_change_1y")
+        self._momentum_thresholds = np.array([-5.0, 0.0, 5.0, 10.0, 15.0])
+        self._momentum_lut = np.array([30.0, 45.0, 60.0, 70.0, 80.0, 90.0])
+        self._momentum_weights = np.array([0.4, 0.3, 0.2, 0.1])
     
     def score_financial_data(self, financial_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -42,14 +84,12 @@ class QuantitativeScorer:
         health_score = self._score_financial_health(financial_data)
         momentum_score = self._score_momentum(financial_data)
         
-        # Calculate weighted score
-        total_score = (
-            valuation_score * self.weights["valuation"] +
-            profitability_score * self.weights["profitability"] +
-            growth_score * self.weights["growth"] +
-            health_score * self.weights["financial_health"] +
-            momentum_score * self.weights["momentum"]
+        # Calculate weighted score (single dot product over the categories)
+        category_scores = np.array(
+            [valuation_score, profitability_score, growth_score, health_score, momentum_score],
+            dtype=np.float64
         )
+        total_score = float(self._weight_vec @ category_scores)
         
         # Calculate confidence based on data completeness
         confidence = financial_data.get("data_completeness", 50)
@@ -67,6 +107,121 @@ class QuantitativeScorer:
             "raw_data": financial_data
         }
     
+    def score_batch(self, financial_data_list: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Score a whole portfolio at once using columnar (SoA) arrays.
+
+        Each metric becomes one NumPy column over all tickers, so the
+        threshold ladders run as vectorized searchsorted calls instead of
+        Python branches per ticker. Bucket boundaries match the per-ticker
+        _score_* methods exactly.
+
+        Args:
+            financial_data_list: Financial metrics dicts from get_company_data
+
+        Returns:
+            Array of overall scores (0-100), one per ticker
+        """
+        n = len(financial_data_list)
+        if n == 0:
+            return np.empty(0, dtype=np.float64)
+
+        # Valuation (lower ratios are better -> side="right")
+        pe = _metric_column(financial_data_list, "pe_ratio")
+        peg = _metric_column(financial_data_list, "peg_ratio")
+        pb = _metric_column(financial_data_list, "price_to_book")
+        valuation = _category_mean(np.vstack([
+            _ladder_scores(np.where(pe > 0, pe, np.nan),
+                           np.array([10.0, 15.0, 20.0, 30.0]),
+                           np.array([90.0, 80.0, 70.0, 50.0, 30.0]), side="right"),
+            _ladder_scores(np.where(peg > 0, peg, np.nan),
+                           np.array([1.0, 1.5, 2.0]),
+                           np.array([85.0, 70.0, 55.0, 40.0]), side="right"),
+            _ladder_scores(np.where(pb > 0, pb, np.nan),
+                           np.array([1.0, 2.0, 3.0]),
+                           np.array([90.0, 75.0, 60.0, 40.0]), side="right"),
+        ]))
+
+        # Profitability (percentages, higher is better)
+        profitability = _category_mean(np.vstack([
+            _ladder_scores(_metric_column(financial_data_list, "profit_margin", 100.0),
+                           np.array([5.0, 10.0, 15.0, 20.0]),
+                           np.array([40.0, 60.0, 75.0, 85.0, 95.0])),
+            _ladder_scores(_metric_column(financial_data_list, "operating_margin", 100.0),
+                           np.array([10.0, 15.0, 25.0]),
+                           np.array([45.0, 65.0, 80.0, 95.0])),
+            _ladder_scores(_metric_column(financial_data_list, "roe", 100.0),
+                           np.array([10.0, 15.0, 20.0]),
+                           np.array([40.0, 60.0, 75.0, 90.0])),
+            _ladder_scores(_metric_column(financial_data_list, "roa", 100.0),
+                           np.array([2.0, 5.0, 10.0]),
+                           np.array([40.0, 55.0, 70.0, 90.0])),
+        ]))
+
+        # Growth
+        growth = _category_mean(np.vstack([
+            _ladder_scores(_metric_column(financial_data_list, "revenue_growth", 100.0),
+                           np.array([0.0, 5.0, 10.0, 15.0, 20.0]),
+                           np.array([30.0, 50.0, 60.0, 75.0, 85.0, 95.0])),
+            _ladder_scores(_metric_column(financial_data_list, "earnings_growth", 100.0),
+                           np.array([5.0, 10.0, 15.0, 25.0]),
+                           np.array([40.0, 55.0, 70.0, 80.0, 95.0])),
+        ]))
+
+        # Financial health
+        health = _category_mean(np.vstack([
+            _ladder_scores(_metric_column(financial_data_list, "debt_to_equity"),
+                           np.array([0.5, 1.0, 1.5, 2.0]),
+                           np.array([95.0, 80.0, 65.0, 50.0, 35.0]), side="right"),
+            _ladder_scores(_metric_column(financial_data_list, "current_ratio"),
+                           np.array([1.0, 1.5, 2.0]),
+                           np.array([40.0, 60.0, 80.0, 90.0])),
+            _ladder_scores(_metric_column(financial_data_list, "free_cash_flow"),
+                           np.array([0.0]),
+                           np.array([30.0, 80.0])),
+        ]))
+
+        # Momentum: weighted price-change buckets plus analyst components
+        period_scores = np.vstack([
+            _ladder_scores(_metric_column(financial_data_list, key),
+                           self._momentum_thresholds, self._momentum_lut) * weight
+            for key, weight in zip(self._momentum_keys, self._momentum_weights)
+        ])
+
+        rec_scores = {"strong_buy": 95.0, "buy": 80.0, "hold": 50.0, "sell": 30.0, "strong_sell": 15.0}
+        recommendation = np.array(
+            [rec_scores.get(d.get("recommendation_key"), 50.0)
+             if d.get("recommendation_key") else np.nan
+             for d in financial_data_list],
+            dtype=np.float64
+        )
+
+        target = _metric_column(financial_data_list, "target_mean_price")
+        current = _metric_column(financial_data_list, "current_price")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            upside = np.where(
+                (target > 0) & (current > 0),
+                ((target - current) / current) * 100.0,
+                np.nan
+            )
+        upside_score = _ladder_scores(upside,
+                                      np.array([0.0, 10.0, 20.0]),
+                                      np.array([40.0, 60.0, 75.0, 90.0]))
+
+        momentum_parts = np.vstack([period_scores, recommendation[None, :], upside_score[None, :]])
+        has_momentum = (~np.isnan(momentum_parts)).any(axis=0)
+        momentum = np.where(has_momentum, np.nansum(momentum_parts, axis=0), 50.0)
+
+        # Weighted blend across categories, with the same [0, 100] clamp
+        # score_financial_data applies to its total (the momentum sum alone
+        # can exceed 100, so the clamp is reachable)
+        category_matrix = np.vstack([valuation, profitability, growth, health, momentum])
+        scores = np.clip(self._weight_vec @ category_matrix, 0.0, 100.0)
+
+        # Rows that failed to fetch get the neutral score
+        errored = np.array(["error" in d for d in financial_data_list])
+        return np.where(errored, 50.0, scores)
+
     def _score_valuation(self, data: Dict) -> float:
         """Score valuation metrics (0-100)."""
         scores = []
@@ -253,22 +408,17 @@ class QuantitativeScorer:
         """Score momentum and market sentiment (0-100)."""
         scores = []
         
-        # Price changes (positive momentum is good)
-        for period, weight in [("price_change_1m", 0.4), ("price_change_3m", 0.3), ("price_change_6m", 0.2), ("price_change_1y", 0.1)]:
-            change = data.get(period)
-            if change is not None:
-                if change > 15:
-                    scores.append(90 * weight)
-                elif change > 10:
-                    scores.append(80 * weight)
-                elif change > 5:
-                    scores.append(70 * weight)
-                elif change > 0:
-                    scores.append(60 * weight)
-                elif change > -5:
-                    scores.append(45 * weight)
-                else:
-                    scores.append(30 * weight)
+        # Price changes (positive momentum is good) - all four periods are
+        # bucketed at once through the precomputed threshold table
+        changes = np.array(
+            [data.get(key, np.nan) if data.get(key) is not None else np.nan
+             for key in self._momentum_keys],
+            dtype=np.float64
+        )
+        mask = ~np.isnan(changes)
+        if mask.any():
+            indices = np.searchsorted(self._momentum_thresholds, changes[mask])
+            scores.extend(self._momentum_lut[indices] * self._momentum_weights[mask])
         
         # Analyst recommendation
         rec = data.get("recommendation_key")
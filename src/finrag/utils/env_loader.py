@@ -1,54 +1,83 @@
 """
 Environment variable management utilities for FinRAG.
 """
+import functools
+import logging
 import os
 from pathlib import Path
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+# Cached result of check_required_env_vars (None = not checked yet)
+_env_checked: Optional[bool] = None
+
+
+@functools.lru_cache(maxsize=8)
+def _load_env_cached(env_path_str: str, mtime_ns: int) -> bool:
+    """
+    Load a .env file, memoized on (path, mtime) so repeated calls
+    don't re-read and re-tokenize an unchanged file.
+    """
+    try:
+        from dotenv import load_dotenv
+
+        load_dotenv(dotenv_path=env_path_str, override=True)
+        logger.info("✓ Loaded environment variables from: %s", env_path_str)
+        return True
+
+    except ImportError:
+        logger.warning(
+            "⚠ python-dotenv not installed. "
+            "Install with: pip install python-dotenv. "
+            "Using system environment variables only"
+        )
+        return False
+
 
 def load_env_file(env_path: Optional[str] = None) -> bool:
     """
     Load environment variables from .env file.
-    
+    Results are cached per file path and modification time, so calling
+    this repeatedly (e.g. from worker startup) only parses the file once.
+
     Args:
         env_path: Path to .env file (default: looks in project root)
-    
+
     Returns:
         True if .env file was loaded, False otherwise
     """
-    try:
-        from dotenv import load_dotenv
-        
-        if env_path is None:
-            # Look for .env in project root
-            current_dir = Path(__file__).parent.parent.parent.parent
-            env_path = current_dir / '.env'
-        else:
-            env_path = Path(env_path)
-        
-        if env_path.exists():
-            load_dotenv(dotenv_path=env_path, override=True)
-            print(f"✓ Loaded environment variables from: {env_path}")
-            return True
-        else:
-            print(f"⚠ .env file not found at: {env_path}")
-            print("  Using system environment variables only")
-            return False
-            
-    except ImportError:
-        print("⚠ python-dotenv not installed")
-        print("  Install with: pip install python-dotenv")
-        print("  Using system environment variables only")
+    if env_path is None:
+        # Look for .env in project root
+        current_dir = Path(__file__).parent.parent.parent.parent
+        env_path = current_dir / '.env'
+    else:
+        env_path = Path(env_path)
+
+    if not env_path.exists():
+        logger.warning("⚠ .env file not found at: %s. Using system environment variables only", env_path)
         return False
 
+    return _load_env_cached(str(env_path), env_path.stat().st_mtime_ns)
+
 
-def check_required_env_vars() -> bool:
+def check_required_env_vars(force: bool = False) -> bool:
     """
     Check if required environment variables are set.
-    
+    The result is cached after the first call; pass force=True to
+    re-check (e.g. after mutating os.environ).
+
+    Args:
+        force: Re-run the check even if a cached result exists
+
     Returns:
         True if all required variables are set, False otherwise
     """
+    global _env_checked
+
+    if _env_checked is not None and not force:
+        return _env_checked
+
     required_vars = {
         "OPENAI_API_KEY": "OpenAI API key for embeddings and chat"
     }
@@ -58,29 +87,28 @@ def check_required_env_vars() -> bool:
     }
     
     all_set = True
-    
-    print("\nChecking environment variables:")
-    print("-" * 60)
-    
-    # Check required
+
+    logger.info("Checking environment variables:")
+
+    # Check required (messages are %-formatted lazily so nothing is built
+    # when the log level filters them out)
     for var, description in required_vars.items():
         value = os.getenv(var)
         if value:
-            print(f"✓ {var}: {'*' * 8}{value[-4:]} ({description})")
+            logger.info("✓ %s: %s%s (%s)", var, '*' * 8, value[-4:], description)
         else:
-            print(f"✗ {var}: NOT SET ({description})")
+            logger.warning("✗ %s: NOT SET (%s)", var, description)
             all_set = False
-    
+
     # Check optional
     for var, description in optional_vars.items():
         value = os.getenv(var)
         if value:
-            print(f"✓ {var}: {'*' * 8}{value[-4:]} ({description})")
+            logger.info("✓ %s: %s%s (%s)", var, '*' * 8, value[-4:], description)
         else:
-            print(f"○ {var}: NOT SET (optional - {description})")
-    
-    print("-" * 60)
-    
+            logger.info("○ %s: NOT SET (optional - %s)", var, description)
+
+    _env_checked = all_set
     return all_set
 
 
@@ -181,6 +209,9 @@ Or use .env file (recommended for persistent setup)
 
 if __name__ == "__main__":
     """Test environment variable loading."""
+    # Show the log output when run directly
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     print("Testing environment variable loading...")
     print("=" * 60)
     
@@ -2,11 +2,20 @@
 Filtered document parser for extracting specific sections from financial reports.
 Based on the working LlamaParse integration with consolidation logic.
 """
+import gzip
 import re
 import json
+from collections import defaultdict
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
+# orjson serializes at C level and emits bytes directly; fall back to
+# stdlib json when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class FilteredDocumentParser:
     """
@@ -34,7 +43,14 @@ class FilteredDocumentParser:
         ]
         
         self.sections_to_extract = sections_to_extract or self.default_sections
-        
+
+        # Title-cased section names, computed once since the section set
+        # is fixed for the lifetime of the parser
+        self._section_titles = {
+            section: section.replace("_", " ").title()
+            for section in set(self.default_sections) | set(self.sections_to_extract)
+        }
+
         # Define section patterns for regex matching (based on working code)
         self.section_patterns = {
             "board_of_directors_changes": r"\*?\*?Board of Directors Changes?\*?\*?",
@@ -47,7 +63,27 @@ class FilteredDocumentParser:
             "operational_metrics": r"\*?\*?Operational Metrics?\*?\*?",
             "corporate_governance": r"\*?\*?Corporate Governance\*?\*?"
         }
-    
+
+        self._split_re = re.compile(r'(?=\d+\.\s+\*?\*?Board)')
+        # All section headers unified into one alternation with named groups,
+        # so each chunk is scanned once instead of once per section. The
+        # optional numbering prefix is matched too, keeping it out of the
+        # content slice of the preceding section. Only active sections get
+        # a named group - inactive headers still delimit content but yield
+        # lastgroup None, so no per-match membership check is needed.
+        # Every branch is anchored to a line start (MULTILINE) so a prose
+        # mention of a section name inside bullet content cannot terminate
+        # the section being collected.
+        active = frozenset(self.sections_to_extract)
+        self._all_sections_re = re.compile(
+            '|'.join(
+                f'^[ \\t]*(?:\\d+\\.\\s+)?'
+                + (f'(?P<{key}>{pattern})' if key in active else f'(?:{pattern})')
+                for key, pattern in self.section_patterns.items()
+            ),
+            re.IGNORECASE | re.MULTILINE
+        )
+
     def generate_system_prompt(self) -> str:
         """
         Generate system prompt for LlamaParse to extract specific sections.
@@ -84,58 +120,68 @@ If information exists, extract exact details concisely.'''
         Returns:
             Dictionary mapping section names to lists of extracted content
         """
-        # Initialize consolidated data structure
-        consolidated = {section: [] for section in self.sections_to_extract}
-        
-        # Split text into chunks (assuming each page/section starts with "1.")
-        chunks = re.split(r'(?=\d+\.\s+\*?\*?Board)', raw_text)
-        
-        for chunk in chunks:
-            if not chunk.strip():
+        # Sections materialize lazily as they are hit, with parallel sets
+        # for O(1) case-insensitive dedup instead of scanning the lists
+        consolidated = defaultdict(list)
+        seen = defaultdict(set)
+
+        # Locate chunk boundaries (each page/section starts with "1.")
+        # without materializing every chunk up front; each span is sliced
+        # only as it is processed
+        boundaries = [m.start() for m in self._split_re.finditer(raw_text)]
+        if not boundaries or boundaries[0] != 0:
+            boundaries.insert(0, 0)
+        boundaries.append(len(raw_text))
+
+        for span_start, span_end in zip(boundaries, boundaries[1:]):
+            chunk = raw_text[span_start:span_end]
+            # isspace() scans without allocating a stripped copy
+            if not chunk or chunk.isspace():
                 continue
-                
-            for key, pattern in self.section_patterns.items():
-                if key not in self.sections_to_extract:
+
+            # One linear scan finds every section header in the chunk;
+            # content is the slice between consecutive headers
+            matches = list(self._all_sections_re.finditer(chunk))
+
+            for idx, match in enumerate(matches):
+                key = match.lastgroup
+                if key is None:  # Header of a section we're not extracting
                     continue
-                    
-                # Find the section in the chunk
-                match = re.search(pattern, chunk, re.IGNORECASE)
-                if match:
-                    # Extract content after the section header until the next section
-                    start = match.end()
-                    # Find the next section or end of chunk
-                    next_section = re.search(r'\n\d+\.\s+\*?\*?[A-Z]|\n\*?\*?[A-Z][a-z]+', chunk[start:])
-                    if next_section:
-                        content = chunk[start:start + next_section.start()].strip()
-                    else:
-                        content = chunk[start:].strip()
-                    
-                    # Process bullet points
-                    if content:
-                        lines = content.split('\n')
-                        for line in lines:
-                            line = line.strip()
-                            # Skip "Not found in the page" and similar statements
-                            if line and not re.search(r'not found in the page|no (specific )?information|not found|no mention', line, re.IGNORECASE):
-                                # Remove leading bullet points and dashes
-                                line = re.sub(r'^[-•*]\s*', '', line)
-                                if line and line not in consolidated[key]:
-                                    consolidated[key].append(line)
-        
-        # Remove empty sections and duplicates
-        final_output = {}
-        for key, values in consolidated.items():
-            if values:
-                # Remove duplicates while preserving order
-                unique_values = []
-                seen = set()
-                for v in values:
-                    if v.lower() not in seen:
-                        seen.add(v.lower())
-                        unique_values.append(v)
-                final_output[key] = unique_values
-        
-        return final_output
+
+                start = match.end()
+                end = matches[idx + 1].start() if idx + 1 < len(matches) else len(chunk)
+                content = chunk[start:end].strip()
+
+                # Process bullet points
+                if content:
+                    lines = content.split('\n')
+                    for line in lines:
+                        # Remove leading bullet points and dashes
+                        # (C-level lstrip beats a regex for this)
+                        line = line.strip().lstrip('-•* \t')
+                        if not line:
+                            continue
+                        line_lower = line.lower()
+                        # Skip "Not found in the page" and similar
+                        # statements; plain substring scans cover every
+                        # alternative of the old regex at memmem speed
+                        if ('not found' in line_lower
+                                or 'no information' in line_lower
+                                or 'no specific information' in line_lower
+                                or 'no mention' in line_lower):
+                            continue
+                        if line_lower not in seen[key]:
+                            seen[key].add(line_lower)
+                            consolidated[key].append(line)
+
+        # Empty sections were never created, so no filtering pass is
+        # needed; one cheap rebuild restores the canonical section order
+        # (lazily materialized sections come out in encounter order)
+        return {
+            section: consolidated[section]
+            for section in self.sections_to_extract
+            if section in consolidated
+        }
     
     def convert_to_text(self, consolidated_data: Dict[str, List[str]]) -> str:
         """
@@ -147,20 +193,20 @@ If information exists, extract exact details concisely.'''
         Returns:
             Plain text string
         """
+        # One joined block per section keeps the parts list O(sections)
+        # instead of O(items)
         text_parts = []
-        
+
         for section, items in consolidated_data.items():
             if not items:
                 continue
-            
+
             # Format section name
-            section_title = section.replace("_", " ").title()
-            text_parts.append(f"\n{section_title}:")
-            
-            # Add items
-            for item in items:
-                text_parts.append(f"  - {item}")
-        
+            section_title = self._section_titles.get(section) or section.replace("_", " ").title()
+            text_parts.append(
+                f"\n{section_title}:\n" + "\n".join(f"  - {item}" for item in items)
+            )
+
         return "\n".join(text_parts)
     
     def convert_to_markdown(self, consolidated_data: Dict[str, List[str]]) -> str:
@@ -174,19 +220,17 @@ If information exists, extract exact details concisely.'''
             Markdown string
         """
         md_parts = []
-        
+
         for section, items in consolidated_data.items():
             if not items:
                 continue
-            
+
             # Format section name
-            section_title = section.replace("_", " ").title()
-            md_parts.append(f"\n## {section_title}\n")
-            
-            # Add items
-            for item in items:
-                md_parts.append(f"- {item}")
-        
+            section_title = self._section_titles.get(section) or section.replace("_", " ").title()
+            md_parts.append(
+                f"\n## {section_title}\n\n" + "\n".join(f"- {item}" for item in items)
+            )
+
         return "\n".join(md_parts)
     
     def convert_to_json(self, consolidated_data: Dict[str, List[str]]) -> str:
@@ -199,48 +243,83 @@ If information exists, extract exact details concisely.'''
         Returns:
             JSON string
         """
+        if orjson is not None:
+            return orjson.dumps(consolidated_data, option=orjson.OPT_INDENT_2).decode()
         return json.dumps(consolidated_data, indent=2)
     
     def save_outputs(
-        self, 
-        consolidated_data: Dict[str, List[str]], 
+        self,
+        consolidated_data: Dict[str, List[str]],
         output_dir: str,
-        base_filename: str = "filtered_output"
+        base_filename: str = "filtered_output",
+        compress: bool = False
     ) -> Dict[str, str]:
         """
         Save consolidated data in multiple formats.
-        
+
         Args:
             consolidated_data: Dictionary of section name to content list
             output_dir: Directory to save files
             base_filename: Base name for output files
-        
+            compress: Gzip the JSON output (.json.gz) to cut disk I/O
+                when saving per document in a pipeline
+
         Returns:
             Dictionary mapping format to file path
         """
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
-        
+
+        # Build text and markdown in one pass over the sections instead of
+        # one full traversal per format
+        text_parts = []
+        md_parts = []
+
+        for section, items in consolidated_data.items():
+            if not items:
+                continue
+
+            section_title = self._section_titles.get(section) or section.replace("_", " ").title()
+            text_parts.append(
+                f"\n{section_title}:\n" + "\n".join(f"  - {item}" for item in items)
+            )
+            md_parts.append(
+                f"\n## {section_title}\n\n" + "\n".join(f"- {item}" for item in items)
+            )
+
+        if orjson is not None:
+            json_bytes = orjson.dumps(consolidated_data, option=orjson.OPT_INDENT_2)
+        else:
+            json_bytes = json.dumps(consolidated_data, indent=2).encode("utf-8")
+
         saved_files = {}
-        
-        # Save as JSON
-        json_path = output_path / f"{base_filename}.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            f.write(self.convert_to_json(consolidated_data))
-        saved_files["json"] = str(json_path)
-        
-        # Save as Markdown
-        md_path = output_path / f"{base_filename}.md"
-        with open(md_path, "w", encoding="utf-8") as f:
-            f.write(self.convert_to_markdown(consolidated_data))
-        saved_files["markdown"] = str(md_path)
-        
-        # Save as plain text
-        txt_path = output_path / f"{base_filename}.txt"
-        with open(txt_path, "w", encoding="utf-8") as f:
-            f.write(self.convert_to_text(consolidated_data))
-        saved_files["text"] = str(txt_path)
-        
+
+        # Extensions are appended to the base filename rather than set via
+        # with_suffix(), which would truncate dotted names like "report.q4"
+        if compress:
+            # compresslevel=1 is ~4x faster to write than the default 9
+            # and still shrinks JSON severalfold
+            json_path = output_path / f"{base_filename}.json.gz"
+            with gzip.open(json_path, "wb", compresslevel=1) as f:
+                f.write(json_bytes)
+            saved_files["json"] = str(json_path)
+        else:
+            json_path = output_path / f"{base_filename}.json"
+            with open(json_path, "wb", buffering=1 << 20) as f:
+                f.write(json_bytes)
+            saved_files["json"] = str(json_path)
+
+        # Write pre-encoded bytes through a large buffer - one encode and
+        # few syscalls per file instead of text-layer encoding per write
+        outputs = (
+            ("markdown", output_path / f"{base_filename}.md", "\n".join(md_parts).encode("utf-8")),
+            ("text", output_path / f"{base_filename}.txt", "\n".join(text_parts).encode("utf-8")),
+        )
+        for fmt, path, payload in outputs:
+            with open(path, "wb", buffering=1 << 20) as f:
+                f.write(payload)
+            saved_files[fmt] = str(path)
+
         return saved_files
     
     def get_statistics(self, consolidated_data: Dict[str, List[str]]) -> Dict[str, Any]:
@@ -253,17 +332,22 @@ If information exists, extract exact details concisely.'''
         Returns:
             Dictionary with statistics
         """
-        total_items = sum(len(items) for items in consolidated_data.values())
-        sections_with_data = sum(1 for items in consolidated_data.values() if items)
-        
+        # Single pass over the sections computes all three aggregates
+        total_items = 0
+        sections_with_data = 0
+        items_per_section = {}
+
+        for section, items in consolidated_data.items():
+            count = len(items)
+            if count:
+                total_items += count
+                sections_with_data += 1
+                items_per_section[section] = count
+
         return {
             "total_sections": len(self.sections_to_extract),
             "sections_with_data": sections_with_data,
             "total_items": total_items,
             "coverage": (sections_with_data / len(self.sections_to_extract)) * 100 if self.sections_to_extract else 0,
-            "items_per_section": {
-                section: len(items) 
-                for section, items in consolidated_data.items() 
-                if items
-            }
+            "items_per_section": items_per_section
         }
@@ -1,23 +1,78 @@
 """
 Utility functions for FinRAG.
 """
-from typing import List, Dict, Any
-import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
+from __future__ import annotations
 
+import re
+from typing import List, Dict, Any, TYPE_CHECKING
 
-def calculate_similarity(embedding1: np.ndarray, embedding2: np.ndarray) -> float:
+# numpy is only needed by the similarity helpers; importing it lazily
+# keeps module load fast for callers that just format or extract text
+if TYPE_CHECKING:
+    import numpy as np
+
+# Entity patterns compiled once at import time instead of per call.
+# The year group is non-capturing so findall returns the full match.
+_MONEY_RE = re.compile(r'\$[\d,]+(?:\.\d+)?[KMB]?')
+_PCT_RE = re.compile(r'\d+(?:\.\d+)?%')
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+
+# (divisor, unit) pairs for financial number formatting, largest first
+_UNITS = ((1e9, 'B'), (1e6, 'M'), (1e3, 'K'))
+
+# Unit suffixes indexed by bucket, matching _scale_fin's return index
+_UNIT_BY_INDEX = ('', 'K', 'M', 'B')
+
+
+def _scale_fin(value: float):
+    """Scale a value into its display unit; returns (scaled_value, unit_index)."""
+    magnitude = abs(value)
+    if magnitude >= 1e9:
+        return value / 1e9, 3
+    if magnitude >= 1e6:
+        return value / 1e6, 2
+    if magnitude >= 1e3:
+        return value / 1e3, 1
+    return value, 0
+
+
+# JIT-compile the numeric kernel when numba is available; the pure-Python
+# version above is the fallback. Only the scaling is jitted - the f-string
+# assembly stays at the Python level where it belongs.
+try:
+    from numba import njit
+    _scale_fin = njit(cache=True)(_scale_fin)
+except ImportError:
+    pass
+
+
+def calculate_similarity(
+    embedding1: np.ndarray,
+    embedding2: np.ndarray,
+    normalized: bool = False
+) -> float:
     """
     Calculate cosine similarity between two embeddings.
-    
+
     Args:
         embedding1: First embedding
         embedding2: Second embedding
-    
+        normalized: Set True when both embeddings are already
+            L2-normalized to skip the norm computation
+
     Returns:
         Similarity score (0-1)
     """
-    return float(cosine_similarity([embedding1], [embedding2])[0][0])
+    import numpy as np
+
+    # A single fused dot product beats sklearn's cosine_similarity, which
+    # promotes both vectors to 2D arrays and validates them on every call
+    if normalized:
+        return float(np.dot(embedding1, embedding2))
+    return float(
+        np.dot(embedding1, embedding2)
+        / (np.linalg.norm(embedding1) * np.linalg.norm(embedding2) + 1e-12)
+    )
 
 
 def format_financial_number(value: float, prefix: str = "$", suffix: str = "") -> str:
@@ -32,14 +87,37 @@ def format_financial_number(value: float, prefix: str = "$", suffix: str = "") -
     Returns:
         Formatted string
     """
-    if value >= 1e9:
-        return f"{prefix}{value/1e9:.2f}B{suffix}"
-    elif value >= 1e6:
-        return f"{prefix}{value/1e6:.2f}M{suffix}"
-    elif value >= 1e3:
-        return f"{prefix}{value/1e3:.2f}K{suffix}"
-    else:
-        return f"{prefix}{value:.2f}{suffix}"
+    # Table-driven bucket lookup; abs() keeps large negatives scaled too
+    magnitude = abs(value)
+    for divisor, unit in _UNITS:
+        if magnitude >= divisor:
+            return f"{prefix}{value/divisor:.2f}{unit}{suffix}"
+    return f"{prefix}{value:.2f}{suffix}"
+
+
+def format_financial_numbers(
+    values: List[float],
+    prefix: str = "$",
+    suffix: str = ""
+) -> List[str]:
+    """
+    Format a batch of numbers as financial values.
+    Uses the (optionally numba-compiled) scaling kernel per value so tight
+    report-generation loops don't pay the full formatter overhead per cell.
+
+    Args:
+        values: Numeric values
+        prefix: Prefix (e.g., "$")
+        suffix: Suffix (e.g., "M", "B")
+
+    Returns:
+        List of formatted strings
+    """
+    formatted = []
+    for value in values:
+        scaled, idx = _scale_fin(float(value))
+        formatted.append(f"{prefix}{scaled:.2f}{_UNIT_BY_INDEX[idx]}{suffix}")
+    return formatted
 
 
 def extract_financial_entities(text: str) -> Dict[str, List[str]]:
@@ -53,27 +131,14 @@ def extract_financial_entities(text: str) -> Dict[str, List[str]]:
     Returns:
         Dictionary of entity types and their values
     """
-    import re
-    
-    entities = {
-        "money": [],
-        "percent": [],
-        "dates": []
+    return {
+        # Monetary amounts (e.g., $150M, $1.5B)
+        "money": _MONEY_RE.findall(text),
+        # Percentages (e.g., 25%, 12.5%)
+        "percent": _PCT_RE.findall(text),
+        # Years (e.g., 2024, 2023)
+        "dates": _YEAR_RE.findall(text)
     }
-    
-    # Extract monetary amounts (e.g., $150M, $1.5B)
-    money_pattern = r'\$[\d,]+(?:\.\d+)?[KMB]?'
-    entities["money"] = re.findall(money_pattern, text)
-    
-    # Extract percentages (e.g., 25%, 12.5%)
-    percent_pattern = r'\d+(?:\.\d+)?%'
-    entities["percent"] = re.findall(percent_pattern, text)
-    
-    # Extract years (e.g., 2024, 2023)
-    year_pattern = r'\b(19|20)\d{2}\b'
-    entities["dates"] = re.findall(year_pattern, text)
-    
-    return entities
 
 
 def merge_chunks_by_similarity(
@@ -94,36 +159,41 @@ def merge_chunks_by_similarity(
     """
     if len(chunks) <= 1:
         return chunks
-    
+
+    import numpy as np
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components
+
+    # Compute the full similarity matrix with one BLAS matmul on
+    # L2-normalized embeddings instead of one call per pair
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True).clip(1e-12)
+    normalized = embeddings / norms
+    sim = normalized @ normalized.T
+
+    # Treat similar pairs as edges and merge whole connected components,
+    # so transitively similar chunks (i~j, j~k) end up together even when
+    # i and k don't match directly
+    adjacency = sim >= threshold
+    np.fill_diagonal(adjacency, False)
+    n_components, labels = connected_components(
+        csr_matrix(adjacency), directed=False
+    )
+
+    component_indices: List[List[int]] = [[] for _ in range(n_components)]
+    for idx, label in enumerate(labels):
+        component_indices[label].append(idx)
+
+    # Order components by their first chunk to keep output stable
+    component_indices.sort(key=lambda indices: indices[0])
+
     merged = []
-    used = set()
-    
-    for i in range(len(chunks)):
-        if i in used:
-            continue
-        
-        current_chunk = chunks[i]
-        current_text = [current_chunk["text"]]
-        used.add(i)
-        
-        # Find similar chunks
-        for j in range(i + 1, len(chunks)):
-            if j in used:
-                continue
-            
-            sim = calculate_similarity(embeddings[i], embeddings[j])
-            if sim >= threshold:
-                current_text.append(chunks[j]["text"])
-                used.add(j)
-        
-        # Create merged chunk
-        merged_chunk = {
-            "text": "\n\n".join(current_text),
-            "chunk_id": current_chunk["chunk_id"],
-            "merged_from": len(current_text)
-        }
-        merged.append(merged_chunk)
-    
+    for indices in component_indices:
+        merged.append({
+            "text": "\n\n".join(chunks[idx]["text"] for idx in indices),
+            "chunk_id": chunks[indices[0]]["chunk_id"],
+            "merged_from": len(indices)
+        })
+
     return merged
 
 
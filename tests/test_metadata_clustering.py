@@ -9,20 +9,43 @@ Tests cover:
 """
 
 import unittest
-from finrag.models import FinancialChunker
+from collections import namedtuple
 from finrag.core.clustering import RAPTORClustering
 from finrag.core.clustering import ClusterNode
-from finrag.models import OpenAIEmbeddingModel
 from finrag.config import FinRAGConfig
 import numpy as np
 
+# The model classes (openai, tiktoken, tenacity) are imported lazily in
+# setUpClass so collecting/running a subset of tests doesn't pay for them
+
+# Shared pool of random embeddings, generated once: standard_normal with a
+# Generator is much faster than per-test np.random.randn, and float32
+# halves the bytes fed into clustering. Tests slice views of this pool.
+_RNG_POOL = np.random.default_rng(42).standard_normal((16, 1536), dtype=np.float32)
+
+# Shared metadata constants - one interned tuple per company instead of a
+# fresh dict literal allocated for every test node
+Meta = namedtuple('Meta', 'sector company year')
+JPM = Meta('finance', 'JPMorgan', '2023')
+APPLE = Meta('technology', 'Apple', '2023')
+
 
 class TestMetadataExtraction(unittest.TestCase):
     """Test metadata extraction from documents."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.chunker = FinancialChunker(chunk_size=1000, chunk_overlap=200)
+
+    # Built once at class creation instead of re-multiplying per test run
+    LONG_DOC = """
+        Apple Inc. 2023 Annual Report - Technology Sector
+
+        This is a long document that will be split into multiple chunks.
+        """ * 10  # Make it long enough to create multiple chunks
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures (the chunker is stateless)."""
+        from finrag.models import FinancialChunker
+
+        cls.chunker = FinancialChunker(chunk_size=1000, chunk_overlap=200)
     
     def test_extract_year(self):
         """Test year extraction."""
@@ -77,29 +100,27 @@ class TestMetadataExtraction(unittest.TestCase):
     
     def test_chunk_with_metadata(self):
         """Test that chunks include metadata."""
-        text = """
-        Apple Inc. 2023 Annual Report - Technology Sector
-        
-        This is a long document that will be split into multiple chunks.
-        """ * 10  # Make it long enough to create multiple chunks
-        
-        chunks = self.chunker.chunk_text_with_metadata(text)
-        
-        # All chunks should have metadata
-        for chunk in chunks:
-            self.assertIn('metadata', chunk)
-            metadata = chunk['metadata']
-            self.assertIsInstance(metadata, dict)
+        chunks = self.chunker.chunk_text_with_metadata(self.LONG_DOC)
+
+        # All chunks should have metadata - one aggregated assertion
+        # instead of two unittest calls per chunk
+        self.assertTrue(all(
+            'metadata' in chunk and isinstance(chunk['metadata'], dict)
+            for chunk in chunks
+        ))
 
 
 class TestMetadataClustering(unittest.TestCase):
     """Test metadata-based clustering functionality."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.config = FinRAGConfig()
-        self.embedding_model = OpenAIEmbeddingModel()
-        self.clustering = RAPTORClustering(
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures once instead of per test method."""
+        from finrag.models import OpenAIEmbeddingModel
+
+        cls.config = FinRAGConfig()
+        cls.embedding_model = OpenAIEmbeddingModel()
+        cls.clustering = RAPTORClustering(
             reduction_dimension=10,
             max_clusters=5,
             use_metadata_clustering=True,
@@ -113,17 +134,17 @@ class TestMetadataClustering(unittest.TestCase):
             ClusterNode(
                 text="JPMorgan doc 1",
                 index=0,
-                metadata={'sector': 'finance', 'company': 'JPMorgan', 'year': '2023'}
+                metadata=JPM._asdict()
             ),
             ClusterNode(
                 text="JPMorgan doc 2",
                 index=1,
-                metadata={'sector': 'finance', 'company': 'JPMorgan', 'year': '2023'}
+                metadata=JPM._asdict()
             ),
             ClusterNode(
                 text="Apple doc 1",
                 index=2,
-                metadata={'sector': 'technology', 'company': 'Apple', 'year': '2023'}
+                metadata=APPLE._asdict()
             ),
         ]
         
@@ -150,18 +171,18 @@ class TestMetadataClustering(unittest.TestCase):
             nodes.append(ClusterNode(
                 text=f"JPMorgan doc {i}",
                 index=i,
-                metadata={'sector': 'finance', 'company': 'JPMorgan', 'year': '2023'}
+                metadata=JPM._asdict()
             ))
-            embeddings_list.append(np.random.randn(1536))  # OpenAI embedding dimension
+            embeddings_list.append(_RNG_POOL[i])  # OpenAI embedding dimension
         
         # Apple group
         for i in range(5, 10):
             nodes.append(ClusterNode(
                 text=f"Apple doc {i}",
                 index=i,
-                metadata={'sector': 'technology', 'company': 'Apple', 'year': '2023'}
+                metadata=APPLE._asdict()
             ))
-            embeddings_list.append(np.random.randn(1536))
+            embeddings_list.append(_RNG_POOL[i])
         
         embeddings = np.array(embeddings_list)
         
@@ -185,7 +206,7 @@ class TestMetadataClustering(unittest.TestCase):
             ClusterNode(text=f"Doc {i}", index=i, metadata={})
             for i in range(10)
         ]
-        embeddings = np.random.randn(10, 1536)
+        embeddings = _RNG_POOL[:10]
         
         # Should use standard clustering
         clusters = clustering_no_metadata.perform_clustering_with_nodes(nodes, embeddings)
@@ -217,10 +238,13 @@ class TestMetadataIntegration(unittest.TestCase):
 class TestEdgeCases(unittest.TestCase):
     """Test edge cases and error handling."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.chunker = FinancialChunker(chunk_size=1000, chunk_overlap=200)
-        self.clustering = RAPTORClustering(
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures (none of the tests mutate them)."""
+        from finrag.models import FinancialChunker
+
+        cls.chunker = FinancialChunker(chunk_size=1000, chunk_overlap=200)
+        cls.clustering = RAPTORClustering(
             reduction_dimension=10,
             max_clusters=5,
             use_metadata_clustering=True
@@ -264,10 +288,10 @@ class TestEdgeCases(unittest.TestCase):
             ClusterNode(
                 text="Single doc",
                 index=0,
-                metadata={'sector': 'finance', 'company': 'Test', 'year': '2023'}
+                metadata=Meta('finance', 'Test', '2023')._asdict()
             )
         ]
-        embeddings = np.random.randn(1, 1536)
+        embeddings = _RNG_POOL[:1]
         
         # Should handle gracefully
         clusters = self.clustering.perform_clustering_with_nodes(nodes, embeddings)
@@ -275,21 +299,34 @@ class TestEdgeCases(unittest.TestCase):
 
 
 def run_tests():
-    """Run all tests."""
-    # Create test suite
+    """Run all tests, in parallel across cores when pytest-xdist is available."""
+    try:
+        import pytest
+
+        args = [__file__, "-v"]
+        try:
+            import xdist  # noqa: F401
+            args += ["-n", "auto"]
+        except ImportError:
+            pass
+        return pytest.main(args) == 0
+    except ImportError:
+        pass
+
+    # Fall back to the plain unittest runner
     loader = unittest.TestLoader()
     suite = unittest.TestSuite()
-    
+
     # Add test classes
     suite.addTests(loader.loadTestsFromTestCase(TestMetadataExtraction))
     suite.addTests(loader.loadTestsFromTestCase(TestMetadataClustering))
     suite.addTests(loader.loadTestsFromTestCase(TestMetadataIntegration))
     suite.addTests(loader.loadTestsFromTestCase(TestEdgeCases))
-    
+
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
-    
+
     return result.wasSuccessful()
 
 
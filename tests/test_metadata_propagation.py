@@ -31,12 +31,9 @@ finrag.add_documents([test_doc])
 # Check metadata at each layer
 tree = finrag.tree
 
-# Helper to get tree depth
+# Helper to get tree depth (the tree tracks its max level incrementally)
 def get_tree_depth(tree):
-    if not tree.all_nodes:
-        return 0
-    max_level = max(node.level for node in tree.all_nodes.values())
-    return max_level + 1
+    return tree.get_tree_depth()
 
 num_layers = get_tree_depth(tree)
 
@@ -44,8 +41,9 @@ print(f"\nTree has {num_layers} layers")
 print("\nMetadata at each layer:")
 print("-" * 80)
 
+nodes_by_level = tree.get_nodes_by_level()  # One pass instead of one scan per layer
 for level in range(num_layers):
-    nodes_at_level = [n for n in tree.all_nodes.values() if n.level == level]
+    nodes_at_level = nodes_by_level.get(level, [])
     print(f"\nLayer {level}: {len(nodes_at_level)} nodes")
     
     # Sample a few nodes to check metadata
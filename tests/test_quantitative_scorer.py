@@ -0,0 +1,100 @@
+"""
+Unit tests for the quantitative scorer.
+
+Tests cover:
+- Parity between score_batch and the per-ticker scoring path
+- Clamping when the momentum category saturates the weighted blend
+- Neutral handling of errored fetches and empty batches
+"""
+
+import unittest
+import numpy as np
+from finrag.scoring.quantitative_scorer import QuantitativeScorer
+
+# A strong ticker across every category: the momentum components alone
+# (four maxed price-change buckets + strong_buy + >20% upside) sum to 275,
+# pushing the raw weighted blend past 100 so the clamp is exercised
+STRONG_DATA = {
+    "pe_ratio": 8.0,
+    "peg_ratio": 0.5,
+    "price_to_book": 0.8,
+    "profit_margin": 0.25,
+    "operating_margin": 0.30,
+    "roe": 0.25,
+    "roa": 0.12,
+    "revenue_growth": 0.25,
+    "earnings_growth": 0.30,
+    "debt_to_equity": 0.3,
+    "current_ratio": 2.5,
+    "free_cash_flow": 1e9,
+    "price_change_1m": 20.0,
+    "price_change_3m": 25.0,
+    "price_change_6m": 30.0,
+    "price_change_1y": 40.0,
+    "recommendation_key": "strong_buy",
+    "target_mean_price": 150.0,
+    "current_price": 100.0,
+}
+
+# Only a handful of metrics available - the unavailable categories must
+# fall back to the neutral 50 in both paths
+SPARSE_DATA = {
+    "pe_ratio": 18.0,
+    "profit_margin": 0.08,
+    "debt_to_equity": 1.2,
+}
+
+ERROR_DATA = {
+    "ticker": "FAIL",
+    "error": "fetch failed",
+    "data_completeness": 0.0,
+}
+
+
+class TestScoreBatchParity(unittest.TestCase):
+    """score_batch must agree with score_financial_data ticker by ticker."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.scorer = QuantitativeScorer()
+
+    def test_parity_single_ticker(self):
+        """Batch of one matches the scalar path exactly."""
+        batch_score = self.scorer.score_batch([STRONG_DATA])[0]
+        scalar_score = self.scorer.score_financial_data(STRONG_DATA)["score"]
+        self.assertAlmostEqual(batch_score, scalar_score)
+
+    def test_parity_mixed_batch(self):
+        """Every row of a mixed batch matches its scalar score."""
+        data_list = [STRONG_DATA, SPARSE_DATA, ERROR_DATA]
+        batch_scores = self.scorer.score_batch(data_list)
+        for data, batch_score in zip(data_list, batch_scores):
+            scalar_score = self.scorer.score_financial_data(data)["score"]
+            self.assertAlmostEqual(batch_score, scalar_score)
+
+    def test_momentum_saturation_clamped(self):
+        """A momentum sum above 100 clamps to 100 in both paths."""
+        momentum = self.scorer._score_momentum(STRONG_DATA)
+        self.assertGreater(momentum, 100)
+
+        batch_score = self.scorer.score_batch([STRONG_DATA])[0]
+        scalar_score = self.scorer.score_financial_data(STRONG_DATA)["score"]
+        self.assertEqual(batch_score, 100.0)
+        self.assertEqual(scalar_score, 100.0)
+
+    def test_error_rows_score_neutral(self):
+        """Errored fetches get the neutral 50 in both paths."""
+        batch_score = self.scorer.score_batch([ERROR_DATA])[0]
+        scalar_score = self.scorer.score_financial_data(ERROR_DATA)["score"]
+        self.assertEqual(batch_score, 50.0)
+        self.assertEqual(scalar_score, 50)
+
+    def test_empty_batch(self):
+        """An empty batch returns an empty array."""
+        scores = self.scorer.score_batch([])
+        self.assertIsInstance(scores, np.ndarray)
+        self.assertEqual(len(scores), 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -24,8 +24,9 @@ num_layers = get_tree_depth(finrag.tree)
 print(f"✓ Tree depth calculation works: {num_layers} layer(s)")
 
 # Test accessing nodes by level
+nodes_by_level = finrag.tree.get_nodes_by_level()
 for level in range(num_layers):
-    nodes_at_level = [n for n in finrag.tree.all_nodes.values() if n.level == level]
+    nodes_at_level = nodes_by_level.get(level, [])
     print(f"✓ Level {level}: {len(nodes_at_level)} node(s)")
 
 print()
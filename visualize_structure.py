@@ -2,11 +2,13 @@
 Visual representation of the fixed hierarchical tree structure.
 This script prints a visual diagram showing how the tree is organized.
 """
+import sys
 
-def print_tree_diagram():
-    """Print a visual representation of the fixed hierarchical structure."""
-    
-    diagram = """
+
+# The diagram is a constant, so it is encoded to UTF-8 bytes once at import
+# time and written straight to the stdout buffer, skipping print()'s
+# per-call formatting and encoding.
+_DIAGRAM = """
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                    FINRAG FIXED HIERARCHICAL TREE STRUCTURE                  ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
@@ -155,8 +157,14 @@ Result: Documents retrieved with multi-level context
 ✓ Metadata Preservation: Financial context maintained throughout
 ✓ Scalable: Handles large datasets with sub-clustering
 """
-    
-    print(diagram)
+
+_DIAGRAM_BYTES = _DIAGRAM.encode("utf-8")
+
+
+def print_tree_diagram():
+    """Print a visual representation of the fixed hierarchical structure."""
+    sys.stdout.buffer.write(_DIAGRAM_BYTES)
+    sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":